@@ -2,11 +2,12 @@
 
 from __future__ import division, print_function  # Python 2 and 3 compatibility
 from array import array
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict, deque, namedtuple
 from dataclasses import make_dataclass
-from fractions import Fraction
 from functools import wraps
-from os import devnull
+from os import stat
+from os.path import abspath
 from random import random, choice
 import sys
 from typing import Iterable, Optional, Tuple, Union
@@ -23,6 +24,12 @@ from .utils import (binsearch, invert_dict, LogMethodCalls,
 
 __all__ = ["Gram", "Histogram", "Listogram", "Dictogram"]
 
+# coverage file path -> ((mtime in ns, size), module_to_coverage) for
+# Covergram, holding up to _MAX_COVERAGE_CACHE_SIZE of the most recently
+# used files
+_module_to_coverage_cache = {}
+_MAX_COVERAGE_CACHE_SIZE = 32
+
 
 class Gram(FreqDist):  #, metaclass=LogMethodCalls, logs_size=4):
     """This histogram holds outcomes and frequencies that have been clumped into
@@ -32,11 +39,26 @@ class Gram(FreqDist):  #, metaclass=LogMethodCalls, logs_size=4):
         data_frequency: This represents the input to a probability distribution
         function.
     """
-    __slots__ = ("data_frequency", "sampler")
+    __slots__ = ("_sampler",)
+
+    # read paths that subclasses using LogMethodCalls shouldn't log
+    _NO_LOG = frozenset(("frequency", "__contains__", "items", "sample",
+                         "sample_many", "_index", "index_of",
+                         "rebuild_with_latent_wordcounts"))
 
     def __init__(self, data_frequency):
         super().__init__(data_frequency)
-        self.sampler = Sample(self)
+
+        # every (re)initialization changes bins, so drop any cached sampler;
+        # it's rebuilt the next time something is sampled.
+        self._sampler = None
+
+    @property
+    def sampler(self):
+        """The Sample for the current bins, built on first use."""
+        if self._sampler is None:
+            self._sampler = Sample(self)
+        return self._sampler
 
     def similarity(self, other):
         return super().similarity(other)
@@ -57,22 +79,19 @@ class Gram(FreqDist):  #, metaclass=LogMethodCalls, logs_size=4):
     def sample(self):
         return self.sampler.randbin()
 
+    def sample_many(self, n_samples):
+        """Return a list of n_samples bins, each randomly sampled by weighting
+        its probability of being chosen by its observed frequency."""
+        return self.sampler.randbins(n_samples)
+
     @staticmethod
-    def bin_search(array, prob):
-        """Search for the lowest matching probability in array consisting of
-        namedtuples. this is the sample component of roulette wheel sampling"""
-        lo = 0
-        hi = len(array) - 1
-        while lo <= hi:
-            mid = (lo + hi) // 2
-            if (array[mid].cumulative <= prob and
-                (mid == len(array) - 1 or array[mid + 1].cumulative > prob)):
-                return mid
-            if array[mid].cumulative < prob:
-                lo = mid + 1
-            else:
-                hi = mid
-        return None
+    def bin_search(cumulative, prob):
+        """Search for the lowest matching probability in cumulative, a sorted
+        sequence of the cumulative probability where each bin starts. this is
+        the sample component of roulette wheel sampling"""
+        # the matching bin is the last one starting at or before prob
+        idx = bisect_right(cumulative, prob) - 1
+        return idx if idx >= 0 else None
 
     @staticmethod
     def sents(block_text):
@@ -86,7 +105,9 @@ class Gram(FreqDist):  #, metaclass=LogMethodCalls, logs_size=4):
             The next sentence as a tuple of words.
         """
         for sentence in sent_tokenize(block_text):
-            yield word_tokenize(sentence)
+            # sentence is already split, so don't let word_tokenize split it
+            # again
+            yield word_tokenize(sentence, preserve_line=True)
 
     @staticmethod
     def pos_sents(block_text):
@@ -100,12 +121,12 @@ class Gram(FreqDist):  #, metaclass=LogMethodCalls, logs_size=4):
             The next sentence as a tuple of word and pos_tag tuples.
         """
         for sentence in sent_tokenize(block_text):
-            yield pos_tag(word_tokenize(sentence))
+            yield pos_tag(word_tokenize(sentence, preserve_line=True))
 
 
 class Histogram(Gram, metaclass=LogMethodCalls, logs_size=4):
 
-    __slots__ = ("corpus", "tokens_freqs", "sampler")
+    __slots__ = ()
 
     def __init__(self, corpus=None, tokens_freqs=None, use_pos_tags=False):
         """Takes text or a pregenerated histogram as input."""
@@ -122,11 +143,20 @@ class Histogram(Gram, metaclass=LogMethodCalls, logs_size=4):
         else:
             dtype = type(tokens_freqs)
             super().__init__(tokens_freqs)
-        self.sampler = Sample(self)
 
     def _make_token_freq(self, corpus, use_pos_tags):
-        yield from Gram.pos_sents(corpus) if use_pos_tags else Gram.sents(
-            corpus)
+        """Count every token in corpus, letting Counter tally in C. Words are
+        interned so repeats share one string with a cached hash, and the
+        resulting dict compares them by identity."""
+        if use_pos_tags:
+            tokens = ((sys.intern(word), sys.intern(tag))
+                      for sentence in Gram.pos_sents(corpus)
+                      for word, tag in sentence)
+        else:
+            tokens = (sys.intern(token)
+                      for sentence in Gram.sents(corpus)
+                      for token in sentence)
+        return Counter(tokens)
 
 
 class Listogram(Gram, metaclass=LogMethodCalls, logs_size=4):
@@ -137,7 +167,8 @@ class Listogram(Gram, metaclass=LogMethodCalls, logs_size=4):
         token_list: A list of tokens to generate types and frequencies from.
     """
 
-    __slots__ = ("tokens_list", "tmp_token_freq", "sampler")
+    __slots__ = ("tmp_token_freq", "_dirty", "_tokens", "_freqs",
+                 "_token_index")
 
     def __init__(self, tokens_list=None):
         # hold a temporary array as new (word,counts) get added.
@@ -145,27 +176,45 @@ class Listogram(Gram, metaclass=LogMethodCalls, logs_size=4):
         # finished.
         self.tmp_token_freq = []
 
+        # True when tmp_token_freq holds counts that haven't been merged yet
+        self._dirty = False
+
         if tokens_list is not None:
             super().__init__(tuple(Counter(tokens_list).items()))
         else:
             super().__init__(())
+        self._split_bins()
+
+    def _split_bins(self):
+        """Keep tokens and frequencies from bins in parallel lists, so tokens
+        can be binary searched with bisect. When tokens couldn't be sorted,
+        map each token to its index instead."""
+        self._tokens = [token for token, _ in self.bins]
+        self._freqs = [freq for _, freq in self.bins]
+        self._token_index = (None if self.is_sorted else
+                             {token: i for i, token in enumerate(self._tokens)})
 
     def add_count(self, token, count=1):
         """Increase frequency count of given word by given count amount."""
         # build temp array; duplicates are handled later
         self.tmp_token_freq.append((token, count))
+        self._dirty = True
+
+    def add_counts(self, tokens):
+        """Increase frequency count of each word in tokens by the number of
+        times it occurs there."""
+        # tally the batch in C instead of appending one tuple per token
+        self.tmp_token_freq.extend(Counter(tokens).items())
+        self._dirty = True
 
     def frequency(self, token):
-        self.rebuild_with_latent_wordcounts()
-        try:
-            return super().freq(token)
-        except:
-            raise
+        """Return frequency count of given word, or 0 if word is not found."""
+        index = self.index_of(token)
+        return 0 if index is None else self._freqs[index]
 
     def __contains__(self, token):
         """Return boolean indicating if given word is in this histogram."""
-        self.rebuild_with_latent_wordcounts()
-        return super().__contains__(token)
+        return self.index_of(token) is not None
 
     def _index(self, target):
         """Return the index of entry containing given target word if found in
@@ -177,7 +226,16 @@ class Listogram(Gram, metaclass=LogMethodCalls, logs_size=4):
         """Return the index of entry containing given target word if found in
         this histogram, or None if target word is not found."""
         self.rebuild_with_latent_wordcounts()
-        return self.find(target)
+        try:
+            if self._token_index is not None:
+                return self._token_index.get(target)
+            index = bisect_left(self._tokens, target)
+        except TypeError:
+            # target can't be compared to tokens, so it can't be one of them
+            return None
+        if index < len(self._tokens) and self._tokens[index] == target:
+            return index
+        return None
 
     def sample(self):
         """Return a word from this histogram, randomly sampled by weighting
@@ -188,14 +246,25 @@ class Listogram(Gram, metaclass=LogMethodCalls, logs_size=4):
         except:
             raise
 
+    def sample_many(self, n_samples):
+        """Return a list of n_samples words from this histogram, randomly
+        sampled by weighting each word's probability of being chosen by its
+        observed frequency."""
+        self.rebuild_with_latent_wordcounts()
+        return self.sampler.randbins(n_samples)
+
     def rebuild_with_latent_wordcounts(self):
-        """Reconstruct this object if last method called was add_count."""
-        if len(self._logs_) > 2 and self._logs_[-1 - 2].name == "add_count":
-            # if the most recent class or instance method call wasn't add_count,
-            # re-initialize current object.
-            super().__init__(
-                merge_data_containing_ints(self.bins, self.tmp_token_freq))
-            self.sampler = Sample(self)
+        """Reconstruct this object if add_count was called since the last
+        rebuild."""
+        if not self._dirty:
+            return
+        super().__init__(
+            merge_data_containing_ints(self.bins, self.tmp_token_freq))
+        self._split_bins()
+
+        # latent counts are part of bins now, so start over
+        self.tmp_token_freq = []
+        self._dirty = False
 
 
 class Dictogram(Gram, metaclass=LogMethodCalls, logs_size=4):
@@ -207,13 +276,16 @@ class Dictogram(Gram, metaclass=LogMethodCalls, logs_size=4):
             their corresponding freqencies.
     """
 
-    __slots__ = ("tmp_token_freq", "tokens_list", "sampler")
+    __slots__ = ("tmp_token_freq", "_dirty")
 
     def __init__(self, tokens_list=None):
 
         # Temporarily hold the (word,count) added from add_count, which will
         # be added to a new distribution as part of a new Dictogram
-        self.tmp_token_freq = defaultdict(int)
+        self.tmp_token_freq = Counter()
+
+        # True when tmp_token_freq holds counts that haven't been merged yet
+        self._dirty = False
 
         if tokens_list is not None:
             super().__init__(Counter(tokens_list))
@@ -233,6 +305,14 @@ class Dictogram(Gram, metaclass=LogMethodCalls, logs_size=4):
         """TIME EXPENSIVE: must call super().__init__() every time
         Increase frequency count of given word by given count amount."""
         self.tmp_token_freq[token] += count
+        self._dirty = True
+
+    def add_counts(self, tokens):
+        """Increase frequency count of each word in tokens by the number of
+        times it occurs there."""
+        # Counter.update tallies an iterable in C
+        self.tmp_token_freq.update(tokens)
+        self._dirty = True
 
     def frequency(self, token):
         """Return frequency count of given word, or 0 if word is not found."""
@@ -251,14 +331,25 @@ class Dictogram(Gram, metaclass=LogMethodCalls, logs_size=4):
         except:
             raise
 
+    def sample_many(self, n_samples):
+        """Return a list of n_samples words from this histogram, randomly
+        sampled by weighting each word's probability of being chosen by its
+        observed frequency."""
+        self.rebuild_with_latent_wordcounts()
+        return self.sampler.randbins(n_samples)
+
     def rebuild_with_latent_wordcounts(self):
-        """Reconstructs object if last method called was add_count."""
-        if len(self._logs_) > 2 and self._logs_[-1 - 2].name == "add_count":
-            # if the most recent class or instance method call wasn't add_count,
-            # re-initialize current object.
-            super().__init__(
-                merge_data_containing_ints(self.bins, self.tmp_token_freq))
-            self.sampler = Sample(self)
+        """Reconstructs object if add_count was called since the last
+        rebuild."""
+        if not self._dirty:
+            return
+        token_freq = Counter(self.bins)
+        token_freq.update(self.tmp_token_freq)
+        super().__init__(token_freq)
+
+        # latent counts are part of bins now, so start over
+        self.tmp_token_freq = Counter()
+        self._dirty = False
 
 
 class Fuzzygram(Gram, metaclass=LogMethodCalls, logs_size=4):
@@ -268,34 +359,48 @@ class Fuzzygram(Gram, metaclass=LogMethodCalls, logs_size=4):
 class Covergram(Gram, metaclass=LogMethodCalls, logs_size=4):
     """Takes a coverage report and generates a histogram of modules and their
     corresponding code coverage as a percent."""
-    __slots__ = ("coverage", "coverage_data", "sampler", "_logs_")
+    __slots__ = ("coverage", "coverage_data", "_logs_")
 
     def __init__(self, filepath):
+        # stat the file before reading it, so that if it's rewritten while
+        # being read, the results are cached under the older version and get
+        # recomputed next time instead of going stale
+        filepath = abspath(filepath)
+        file_stat = stat(filepath)
+        # size catches rewrites within one tick of a coarse mtime
+        version = (file_stat.st_mtime_ns, file_stat.st_size)
+
         self.coverage = Coverage(data_file=filepath)
         self.coverage.load()
         self.coverage_data = CoverageData()
         self.coverage_data.read_file(filepath)
-        module_to_coverage = tuple(self.as_module_to_coverage())
+
+        # analyzing every module is the slow part, so reuse the results for a
+        # coverage file that hasn't changed since it was last analyzed
+        cached_version, module_to_coverage = _module_to_coverage_cache.pop(
+            filepath, (None, None))
+        if cached_version != version:
+            module_to_coverage = tuple(self.as_module_to_coverage())
+
+        # (re)insert as the most recently used file, evicting the least
+        # recently used one if the cache is full
+        _module_to_coverage_cache[filepath] = (version, module_to_coverage)
+        if len(_module_to_coverage_cache) > _MAX_COVERAGE_CACHE_SIZE:
+            del _module_to_coverage_cache[next(iter(_module_to_coverage_cache))]
         super().__init__(module_to_coverage)
-        self.sampler = Sample(self)
 
     def as_module_to_coverage(self):
         """Give next (<module name>, <percent module code coverage>) in
         coverage file, a format that can be passed to the FreqDist constructor"""
-        original_stdout = sys.stdout  # store original stdout state
-
-        # temporarily suppress standard output since calling
-        # coverage.Coverage.report causes yucky output
-        sys.stdout = open(devnull, "w")
-        line_counts = self.coverage_data.line_counts()
-        total_lines = sum(count for count in line_counts.values())
-        for module in self.coverage_data._lines:
-
-            # assign coverage as a rational number between 0 and 100
-            module_coverage = Fraction(self.coverage.report(module))
-
-            yield module, int(module_coverage)
-        sys.stdout = original_stdout  # restore standard output
+        for module in self.coverage_data.measured_files():
+            # analysis2 gives the module's statements and the ones that were
+            # missed, without formatting (and printing) a report
+            _, statements, _, missing, _ = self.coverage.analysis2(module)
+            n_statements = len(statements)
+
+            # truncate coverage to an integer percent between 0 and 100
+            yield module, (100 * (n_statements - len(missing)) //
+                           n_statements if n_statements else 0)
 
     def frequency(self, module):
         return self.get(module, 0)
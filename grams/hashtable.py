@@ -1,17 +1,29 @@
 #!python
 
-from .linkedlist import LinkedList
-
 __all__ = []
 
+# marks a slot that doesn't hold a key
+_EMPTY = object()
+
 
 class HashTable(object):
-    __slots__ = ("buckets", "table_size", "load_factor")
+    """Open addressing hash table that uses `Robin Hood hashing`_. Keys, values
+    and hash codes are kept in parallel lists. A key that has probed further
+    from its home slot takes the place of one that hasn't, which keeps probe
+    sequences short and lets lookups stop early.
+
+    .. _Robin Hood hashing:
+        https://cs.uwaterloo.ca/research/tr/1986/CS-86-14.pdf
+    """
+    __slots__ = ("_keys", "_values", "_hashes", "_mask", "table_size",
+                 "load_factor")
 
     def __init__(self, init_size=8):
-        """Initialize this hash table with the given initial size."""
-        # Create a new list (used as fixed-size array) of empty linked lists
-        self.buckets = [LinkedList() for _ in range(init_size)]
+        """Initialize this hash table with the given initial size, rounded up
+        to a power of two."""
+        # round up to a power of two so a slot index is just the low bits of a
+        # hash code
+        self._allocate(1 << max(init_size - 1, 0).bit_length())
         self.table_size = 0
         self.load_factor = .9
 
@@ -27,104 +39,149 @@ class HashTable(object):
     def __iter__(self):
         yield from self.items()
 
-    def _bucket_index(self, key):
-        """Return the bucket index where the given key would be stored."""
-        # Calculate the given key's hash code and transform into bucket index
-        return hash(key) % len(self.buckets)
+    def _allocate(self, capacity):
+        """Replace this table's storage with capacity empty slots."""
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._hashes = [0] * capacity
+        self._mask = capacity - 1
+
+    def _find(self, key):
+        """Return the slot index where the given key is stored, or -1."""
+        key_hash = hash(key)
+        keys, hashes, mask = self._keys, self._hashes, self._mask
+        i = key_hash & mask
+        distance = 0
+        while True:
+            cur_key = keys[i]
+            if cur_key is _EMPTY or (i - hashes[i]) & mask < distance:
+                # key would've taken this slot if it was in the table
+                return -1
+            if hashes[i] == key_hash and (cur_key is key or cur_key == key):
+                return i
+            i = (i + 1) & mask
+            distance += 1
+
+    def _insert(self, key_hash, key, value):
+        """Place a key that isn't in the table yet, displacing keys that are
+        closer to their home slot along the way."""
+        keys, values, hashes = self._keys, self._values, self._hashes
+        mask = self._mask
+        i = key_hash & mask
+        distance = 0
+        while keys[i] is not _EMPTY:
+            cur_distance = (i - hashes[i]) & mask
+            if cur_distance < distance:
+                ## take the slot and carry on placing the key we displaced
+                keys[i], key = key, keys[i]
+                values[i], value = value, values[i]
+                hashes[i], key_hash = key_hash, hashes[i]
+                distance = cur_distance
+            i = (i + 1) & mask
+            distance += 1
+        keys[i], values[i], hashes[i] = key, value, key_hash
+
+    def _resize(self, capacity):
+        """Move every item into a new table with the given capacity."""
+        old_slots = zip(self._keys, self._values, self._hashes)
+        self._allocate(capacity)
+        for key, value, key_hash in old_slots:
+            if key is not _EMPTY:
+                self._insert(key_hash, key, value)
 
     def keys(self):
         """Return a list of all keys in this hash table.
          time:  Θ(n) for the best and worst case; there's never a condition
                 when this function doesn't go through every item."""
-        # Collect all keys in each bucket
-        all_keys = []
-        for bucket in self.buckets:
-            for key, value in bucket.items():
-                all_keys.append(key)
-        return all_keys
+        return [key for key in self._keys if key is not _EMPTY]
 
     def values(self):
         """Return a list of all values in this hash table.
         time:  Θ(n) for the best and worst case; there's never a condition
                when this function doesn't go through every item."""
-        return [value for ll in self.buckets for _, value in ll.items()]
+        return [
+            value for key, value in zip(self._keys, self._values)
+            if key is not _EMPTY
+        ]
 
     def items(self):
         """Return a list of all items (key-value pairs) in this hash table.
         time:  Θ(n) for the best and worst case; there's never a condition
                when this function doesn't go through every item."""
-        # Collect all pairs of key-value entries in each bucket
-        all_items = []
-        for bucket in self.buckets:
-            all_items.extend(bucket.items())
-        return all_items
+        return [
+            item for item in zip(self._keys, self._values)
+            if item[0] is not _EMPTY
+        ]
 
     def length(self):
-        """Return the number of key-value entries by traversing its buckets.
+        """Return the number of key-value entries in this hash table.
         time:   Θ(1) for the best and worst case; length is tracked when other
                 methods are called."""
-        return sum(ll.length() for ll in self.buckets)
+        return self.table_size
 
     def contains(self, key):
         """Return True if this hash table contains the given key, or False.
-        time:   O(n/b) in the worst case; the bucket's entire list is looked
-                through.
-                Θ(1) in the best case; the bucket's list is either empty or
-                the key matches the first node."""
-        try:
-            self.get(key)
-        except:
-            return False
-        return True
+        time:   O(log n) expected in the worst case; probe sequences are short
+                while load stays under load_factor.
+                Θ(1) in the best case; the key's home slot is empty or holds
+                the key."""
+        return self._find(key) != -1
 
     def get(self, key):
         """Return the value associated with the given key, or raise KeyError.
-        time:   O(n/b) in the worst case; the bucket's entire list is looked
-                through.
-                Θ(1) in the best case; the bucket's list is either empty or
-                the key matches the first node."""
-        bucket_idx = self._bucket_index(key)
-        val = self.buckets[bucket_idx].find(lambda item: item[0] == key)
-
-        if val is None:
+        time:   O(log n) expected in the worst case; probe sequences are short
+                while load stays under load_factor.
+                Θ(1) in the best case; the key's home slot is empty or holds
+                the key."""
+        i = self._find(key)
+        if i == -1:
             raise KeyError(f"Key not found: {key}")
-        return val[1]
+        return self._values[i]
 
     def set(self, key, value):
         """Insert or update the given key with its associated value.
-        time:   O(n/b) in the worst case; the bucket's entire list is looked
-                through.
-                Θ(1) in the best case; the bucket's list is either empty or
-                the key matches the first node."""
-        bucket_idx = self._bucket_index(key)
-
-        # subtract this linked list's length from our table
-        self.table_size -= self.buckets[bucket_idx].length()
-
-        self.buckets[bucket_idx].replace(lambda item: item[0] == key,
-                                         (key, value))
-
-        # add back this linked list's length (the differential being 1 or 0)
-        self.table_size += self.buckets[bucket_idx].length()
+        time:   O(log n) expected in the worst case; probe sequences are short
+                while load stays under load_factor. Amortized over the
+                occasional resize.
+                Θ(1) in the best case; the key's home slot is empty or holds
+                the key."""
+        i = self._find(key)
+        if i != -1:
+            # replacing an existing key doesn't change the table's size
+            self._values[i] = value
+            return
+
+        if self.table_size + 1 > self.load_factor * len(self._keys):
+            self._resize(len(self._keys) << 1)
+        self._insert(hash(key), key, value)
+        self.table_size += 1
 
     def delete(self, key):
         """Delete the given key from this hash table, or raise KeyError.
-        time:   O(n/b) in the worst case; the bucket's entire list is looked
-                through.
-                Θ(1) in the best case; the bucket's list is either empty or
-                the key matches the first node."""
-        bucket_idx = self._bucket_index(key)
-
-        try:
-            self.buckets[bucket_idx].replace(lambda item: item[0] == key)
-            self.table_size -= 1
-        except KeyError as e:
-            raise e
+        time:   O(log n) expected in the worst case; probe sequences are short
+                while load stays under load_factor.
+                Θ(1) in the best case; the key's home slot holds the key and
+                the next slot doesn't need to shift back."""
+        i = self._find(key)
+        if i == -1:
+            raise KeyError(f"Key not found: {key}")
+
+        keys, values, hashes = self._keys, self._values, self._hashes
+        mask = self._mask
+        j = (i + 1) & mask
+        while keys[j] is not _EMPTY and (j - hashes[j]) & mask:
+            ## shift following keys back a slot until one is already home,
+            ## so no probe sequence is left with a gap
+            keys[i], values[i], hashes[i] = keys[j], values[j], hashes[j]
+            i = j
+            j = (j + 1) & mask
+        keys[i], values[i] = _EMPTY, None
+        self.table_size -= 1
 
     @property
     def load(self):
         """Give the current load of the table"""
-        return self.table_size / len(self.buckets)
+        return self.table_size / len(self._keys)
 
 
 def test_hash_table():
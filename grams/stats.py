@@ -12,7 +12,8 @@ Attributes:
     Distro: A data structure for managing generic two-dimensional data.
     FreqDist: A data structure for managing groups of occurences and the
         number of times they occur.
-    Sample: Randomly choose an element in a FreqDist in constant time.
+    Sample: Randomly choose an element in a FreqDist, in constant time when
+        weights are roughly uniform and logarithmic time otherwise.
 """
 from array import array
 from collections import Counter, defaultdict, namedtuple
@@ -367,6 +368,9 @@ class FreqDist(Distro):
         # this is the dtype that tokens_freqs will get cast to
         dtype = Distro.classify_dtype(type(tokens_freqs))
 
+        # stays True only if a sequence was actually sorted
+        is_sorted = sort_data
+
         if Distro.is_mapping(dtype):
             ## tokens_freqs is either a dict or a subclass of it
             ## cast to generic dict
@@ -378,6 +382,9 @@ class FreqDist(Distro):
                 try:
                     tokens_freqs = FreqDist.cast(sorted(tokens_freqs), dtype)
                 except TypeError as e:
+                    ## tokens can't be ordered (like tuples padded with None),
+                    ## so they're left in their original order
+                    is_sorted = False
                     InvalidTokenTypeError("Data passed to constructor must be "
                                           f"homogeneous.\n{e}")
         else:
@@ -388,7 +395,7 @@ class FreqDist(Distro):
         # tokens_freqs
         tokens_freqs = FreqDist.cast(self._make_table(tokens_freqs), dtype)
 
-        super().__init__(tokens_freqs, dtype=dtype, is_sorted=sort_data)
+        super().__init__(tokens_freqs, dtype=dtype, is_sorted=is_sorted)
 
     def __getitem__(self, key):
         """Override magic method.
@@ -753,20 +760,30 @@ class FreqDist(Distro):
 
 
 class Sample:
-    """Use Vose's Alias Method to sample from a non-uniform discrete
-    distribution. there's no tradeoff between this and roulette wheel selection;
-    space and time complexity for initialization are equivalent, but time
-    complexity of generation for Vose's Alias Method is theoretically
-    optimal.::
+    """Sample from a discrete distribution. When weights are roughly uniform,
+    `stochastic acceptance`_ is used: pick a random index and accept it with
+    probability w_i / w_max. Expected number of tries is w_max / mean(w), so
+    when the heaviest weight is far from the mean, this falls back on
+    inverting the cumulative distribution, held in a contiguous float64 array.
+    The prob/alias table for Vose's Alias Method is still available, but it's
+    only built when asked for.::
         time:
                 initialization: Θ(n)
-                sampling: Θ(1)
+                sampling: Θ(1) if weights are roughly uniform, else Θ(log n)
         space:  Θ(n)
 
     Args:
         distribution (FreqDist): Any FreqDist object accepted.
+
+    .. _stochastic acceptance:
+        https://arxiv.org/abs/1109.3627
     """
-    __slots__ = ("distribution", "n", "index_key_map", "alias", "prob")
+    __slots__ = ("distribution", "n", "index_key_map", "outcomes", "weights",
+                 "total", "w_max", "use_acceptance", "_alias", "_prob", "_cumulative")
+
+    # largest ratio of max weight to mean weight that stochastic acceptance is
+    # used for; this bounds the expected number of tries per sample.
+    MAX_ACCEPTANCE_RATIO = 2
 
     def __init__(self, distribution: FreqDist):
         self.distribution = distribution
@@ -774,12 +791,48 @@ class Sample:
 
         self.index_key_map = ([k for k in distribution] if Distro.is_mapping(
             distribution.dtype) else None)
-        self.alias, self.prob = self._make_table()
+        self.outcomes = (self.index_key_map if self.index_key_map is not None
+                         else [bin[0] for bin in distribution.bins])
+        self.weights = tuple(distribution.bins.values() if self.index_key_map
+                             is not None else (bin[-1]
+                                               for bin in distribution.bins))
+        self.w_max = max(self.weights, default=0)
+
+        # distribution may be re-initialized in place (like when a Dictogram
+        # merges new counts), so keep the total that weights add up to
+        self.total = distribution.token_count
+
+        # with no total weight, nothing could ever be accepted
+        self.use_acceptance = (self.total > 0 and self.w_max * self.n <=
+                               Sample.MAX_ACCEPTANCE_RATIO * self.total)
+
+        # these are built on first use
+        self._alias = self._prob = None
+        self._cumulative = None
 
     def __repr__(self):
         return "\n".join(f"{'-'*20}\n{attr}:\n{getattr(self, attr)}"
                          for attr in Sample.__slots__)
 
+    @property
+    def alias(self):
+        if self._alias is None:
+            self._alias, self._prob = self._make_table()
+        return self._alias
+
+    @property
+    def prob(self):
+        if self._prob is None:
+            self._alias, self._prob = self._make_table()
+        return self._prob
+
+    @property
+    def cumulative(self):
+        """Running sum of weights as a float64 array, built on first use."""
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self.weights, dtype=np.float64)
+        return self._cumulative
+
     def _make_table(self):
         """Preprocessing step: go through distribution and build up prob/alias
         table. time: best = worst = Θ(n)
@@ -823,16 +876,32 @@ class Sample:
 
     def rand(self):
         """Generation step: calculate the index to an element.
-        time: best = worst = Θ(1)
+        time: Θ(1), expected w_max / mean(w) tries when using stochastic
+              acceptance, otherwise Θ(log n).
 
         Returns:
             The integer index to a selected element in self.distribution.
+
+        Raises:
+            ValueError: The distribution's total weight is 0.
         """
-        i = randrange(self.n)
-        is_heads = random() < self.prob[i]
-        if is_heads:
-            return i
-        return self.alias[i]
+        if self.use_acceptance:
+            while True:
+                i = randrange(self.n)
+                if random() * self.w_max < self.weights[i]:
+                    return i
+        self._check_weight()
+        # the ndarray method skips np.searchsorted's dispatch overhead, which
+        # dominates for a single value
+        return int(
+            self.cumulative.searchsorted(
+                random() * self.total, side="right"))
+
+    def _check_weight(self):
+        """Raise ValueError if there's no weight to sample from."""
+        if self.total <= 0:
+            raise ValueError("Can't sample from a distribution whose total "
+                             "weight is 0.")
 
     def randbin(self):
         """Select an outcome from self.distribution using a random index.
@@ -840,11 +909,30 @@ class Sample:
         Returns:
             An object representing a randomly selected element.
         """
-        if self.index_key_map is None:
-            # self.distribution is a sequence, so the first item at
-            # self.rand() is the outcoume
-            return self.distribution[self.ikey(self.rand())][0]
-        return self.ikey(self.rand())  # the outcome is the key itself
+        # outcomes are laid out by index, so this skips the validation in
+        # FreqDist.__getitem__ on every draw
+        return self.outcomes[self.rand()]
+
+    def randbins(self, n_samples):
+        """Select many outcomes at once by inverting the cumulative
+        distribution for a batch of uniform draws.
+        time: Θ(n_samples log n), in a single numpy call.
+
+        Args:
+            n_samples (int): Number of outcomes to select.
+
+        Returns:
+            list of randomly selected outcomes.
+
+        Raises:
+            ValueError: The distribution's total weight is 0.
+        """
+        self._check_weight()
+        indices = np.searchsorted(
+            self.cumulative,
+            np.random.random(n_samples) * self.total,
+            side="right")
+        return [self.outcomes[i] for i in indices]
 
     def iprob(self, index):
         """Safely get the probability in self.distribution for this index.
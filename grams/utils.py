@@ -28,6 +28,9 @@ class LogMethodCalls(type):
     subclass behavior. Add _logs_ and _times_ features in a way that doesn't interfere
     with anticipated usability.
 
+    Methods named in a _NO_LOG class attribute (on the class or any of its
+    bases) are left unwrapped, so hot paths don't pay for logging.
+
     adapted from: shorturl.at/ikW56
     """
     __slots__ = ()
@@ -45,11 +48,18 @@ class LogMethodCalls(type):
             self.calls += 1
 
     def __new__(cls, name, bases, attrs, logs_size=2):
-        for name, attr in attrs.items():
+        no_log = set(attrs.get("_NO_LOG", ()))
+        for base in bases:
+            no_log.update(getattr(base, "_NO_LOG", ()))
+
+        for attr_name, attr in attrs.items():
+            if attr_name in no_log:
+                continue
             if callable(attr):
-                attrs[name] = LogMethodCalls.logdec(attr, logs_size)
+                attrs[attr_name] = LogMethodCalls.logdec(attr, logs_size)
             elif isinstance(attr, classmethod):
-                attrs[name] = LogMethodCalls.logdec(attr.__func__, logs_size)
+                attrs[attr_name] = LogMethodCalls.logdec(
+                    attr.__func__, logs_size)
 
         if "__slots__" in attrs:
             # when the subclass is using slots, add in our internal
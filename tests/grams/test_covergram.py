@@ -1,14 +1,17 @@
 from collections import Counter
 from contextlib import redirect_stdout
 from io import StringIO
-from os import mkdir, rmdir
+from os import mkdir, rmdir, stat, utime
 from os.path import join
 import sys
+from tempfile import TemporaryDirectory
 import unittest
+from unittest import mock
 
 from coverage import CoverageData
 
-from grams.grams import Covergram, Gram, FreqDist
+from grams.grams import (_MAX_COVERAGE_CACHE_SIZE, _module_to_coverage_cache,
+                         Covergram, Gram, FreqDist)
 from grams.root_exceptions import *
 from grams.utils import capture_stdout
 
@@ -100,3 +103,63 @@ class CovergramTestSuite(unittest.TestCase):
     def test_super_init(self):
         #expected_module_to_coverage =
         pass
+
+    def test_as_module_to_coverage(self):
+        with TemporaryDirectory() as tempdir:
+            module = join(tempdir, "module.py")
+            self.make_file(module, "x = 1\ny = 2\nz = 3\n")
+            empty_module = join(tempdir, "empty_module.py")
+            self.make_file(empty_module, "")
+            coverage_data = CoverageData()
+            coverage_data.add_lines({module: [1], empty_module: []})
+            coverage_filepath = join(tempdir, ".coverage")
+            coverage_data.write_file(coverage_filepath)
+
+            covergram = Covergram(coverage_filepath)
+            # percents are truncated, and a module without statements has no
+            # coverage
+            self.assertCountEqual(covergram.as_module_to_coverage(),
+                                  ((module, 33), (empty_module, 0)))
+
+    def test_module_to_coverage(self):
+        with TemporaryDirectory() as tempdir:
+            module = join(tempdir, "module.py")
+            self.make_file(module, "x = 1\ny = 2\nz = 3\nw = 4\n")
+            coverage_data = CoverageData()
+            coverage_data.add_lines({module: [1, 2, 3]})
+            coverage_filepath = join(tempdir, ".coverage")
+            coverage_data.write_file(coverage_filepath)
+
+            covergram = Covergram(coverage_filepath)
+            self.assertEqual(covergram.bins, ((module, 75),))
+
+            # an unchanged coverage file shouldn't be analyzed again
+            with mock.patch.object(Covergram,
+                                   "as_module_to_coverage") as analyze:
+                self.assertEqual(Covergram(coverage_filepath).bins,
+                                 ((module, 75),))
+                analyze.assert_not_called()
+
+            # rewriting the file within the same mtime tick should still be
+            # picked up
+            mtime_ns = stat(coverage_filepath).st_mtime_ns
+            coverage_data = CoverageData()
+            coverage_data.add_lines({module: [1]})
+            coverage_data.write_file(coverage_filepath)
+            utime(coverage_filepath, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(Covergram(coverage_filepath).bins, ((module, 25),))
+
+    def test_module_to_coverage_cache_size(self):
+        with TemporaryDirectory() as tempdir:
+            module = join(tempdir, "module.py")
+            self.make_file(module, "x = 1\n")
+            for i in range(_MAX_COVERAGE_CACHE_SIZE + 1):
+                coverage_data = CoverageData()
+                coverage_data.add_lines({module: [1]})
+                coverage_data.write_file(join(tempdir, f".coverage.{i}"))
+                Covergram(join(tempdir, f".coverage.{i}"))
+            self.assertLessEqual(len(_module_to_coverage_cache),
+                                 _MAX_COVERAGE_CACHE_SIZE)
+            # the least recently used file is evicted first
+            self.assertNotIn(join(tempdir, ".coverage.0"),
+                             _module_to_coverage_cache)
@@ -66,6 +66,26 @@ class DictogramTest(unittest.TestCase):
         # Verify total count of all word tokens
         assert histogram.token_count == 8 + 14
 
+    def test_add_count_after_rebuild(self):
+        histogram = Dictogram(self.fish_words)
+        histogram.add_count('fish', 2)
+        assert histogram.frequency('fish') == 6
+        # counts that were already merged shouldn't be added again
+        histogram.add_count('red')
+        assert histogram.frequency('fish') == 6
+        assert histogram.frequency('red') == 2
+
+    def test_add_counts(self):
+        histogram = Dictogram(self.fish_words)
+        histogram.add_counts(['two', 'two', 'fish', 'food'])
+        histogram.add_counts(iter(['fish', 'food']))
+        assert histogram.frequency('one') == 1
+        assert histogram.frequency('two') == 3
+        assert histogram.frequency('fish') == 6
+        assert histogram.frequency('food') == 2
+        assert histogram.type_count == 6
+        assert histogram.token_count == 8 + 6
+
     def test_tokens(self):
         histogram = Dictogram(self.fish_words)
         # Verify total count of all word tokens
@@ -92,6 +112,43 @@ class DictogramTest(unittest.TestCase):
             histogram.add_count(word)
         assert histogram.type_count == 5
 
+    def test_sampler_is_lazy(self):
+        histogram = Dictogram(self.fish_words)
+        histogram.add_count('food')
+        histogram.frequency('food')
+        # reads that don't sample shouldn't build a sampler
+        assert histogram._sampler is None
+        sampler = histogram.sampler
+        assert histogram.sampler is sampler
+        # a rebuild invalidates the cached sampler
+        histogram.add_count('food')
+        histogram.sample()
+        assert histogram.sampler is not sampler
+        assert histogram.sampler.n == 6
+
+    def test_sample_zero_counts(self):
+        histogram = Dictogram()
+        histogram.add_count('a', 0)
+        with self.assertRaises(ValueError):
+            histogram.sample()
+
+    def test_held_sampler_after_rebuild(self):
+        histogram = Dictogram(['a', 'x'] + ['b'] * 98)
+        sampler = histogram.sampler
+        histogram.add_count('c', 1000)
+        histogram.frequency('c')
+        # a sampler that was held onto keeps sampling the bins it was built
+        # from
+        for _ in range(1000):
+            assert sampler.randbin() in ('a', 'x', 'b')
+
+    def test_held_sampler_sample_many_after_rebuild(self):
+        histogram = Dictogram(['a', 'x'] + ['b'] * 98)
+        sampler = histogram.sampler
+        histogram.add_count('c', 1000)
+        histogram.frequency('c')
+        assert set(sampler.randbins(2000)) <= {'a', 'x', 'b'}
+
     def test_sample(self):
         histogram = Dictogram(self.fish_words)
         # Create a list of 10,000 word samples from histogram
@@ -109,3 +166,13 @@ class DictogramTest(unittest.TestCase):
             lower_bound = observed_freq * 0.9  # 10% below = 90% = 0.9
             upper_bound = observed_freq * 1.1  # 10% above = 110% = 1.1
             assert lower_bound <= sampled_freq <= upper_bound
+
+    def test_sample_many(self):
+        histogram = Dictogram(self.fish_words)
+        histogram.add_count('food', 8)
+        samples_hist = Dictogram(histogram.sample_many(100000))
+        # words added with add_count should be sampled too
+        for word, count in histogram.items():
+            observed_freq = count / histogram.token_count
+            sampled_freq = samples_hist.frequency(word) / samples_hist.token_count
+            assert observed_freq * 0.9 <= sampled_freq <= observed_freq * 1.1
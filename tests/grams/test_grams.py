@@ -29,6 +29,17 @@ class GramTestSuite(unittest.TestCase):
         actual = first_distro.similarity(second_distro)
         self.assertAlmostEqual(expected, actual, 3)
 
+    def test_bin_search(self):
+        cumulative = (0., .25, .25, .5, .9)
+        self.assertEqual(Gram.bin_search(cumulative, 0.), 0)
+        self.assertEqual(Gram.bin_search(cumulative, .1), 0)
+        # the empty bin starting at .25 is skipped
+        self.assertEqual(Gram.bin_search(cumulative, .25), 2)
+        self.assertEqual(Gram.bin_search(cumulative, .7), 3)
+        self.assertEqual(Gram.bin_search(cumulative, .99), 4)
+        self.assertIsNone(Gram.bin_search(cumulative, -.1))
+        self.assertIsNone(Gram.bin_search((), .5))
+
     def test_show_edges(self):
         dgram = Gram({})
         tgram = Gram(())
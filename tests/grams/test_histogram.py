@@ -10,4 +10,17 @@ from grams.utils import sample_size, map_to_binary
 
 
 class HistogramTestSuite(unittest.TestCase):
-    pass
+
+    def test_init_from_corpus(self):
+        histogram = Histogram("One fish, two fish. Red fish, blue fish.")
+        self.assertEqual(histogram.freq("fish"), 4)
+        self.assertEqual(histogram.freq("two"), 1)
+        self.assertEqual(histogram.freq(","), 2)
+        self.assertEqual(histogram.token_count, 12)
+
+    def test_init_from_corpus_with_pos_tags(self):
+        histogram = Histogram("The fish swim. The fish eat.",
+                              use_pos_tags=True)
+        self.assertEqual(histogram.freq(("The", "DT")), 2)
+        self.assertEqual(histogram.freq((".", ".")), 2)
+        self.assertEqual(histogram.token_count, 8)
@@ -37,6 +37,37 @@ class ListogramTest(unittest.TestCase):
         for word in ('fishy', 'food'):
             assert word not in histogram
 
+    def test_index_of(self):
+        histogram = Listogram(self.fish_words)
+        # bins are sorted by word
+        assert histogram.index_of('blue') == 0
+        assert histogram.index_of('two') == 4
+        assert histogram.index_of('food') is None
+        assert histogram.index_of(None) is None
+        histogram.add_count('food')
+        assert histogram.index_of('food') == 2
+        assert histogram.bins[histogram.index_of('food')] == ('food', 1)
+
+    def test_unorderable_tokens(self):
+        # bigrams padded with None can't be sorted, so bins keep their order
+        bigrams = [(None, 'the'), ('the', 'cat'), ('cat', 'sat'),
+                   ('sat', 'on'), ('on', 'the'), ('the', 'mat'), ('mat', None)]
+        histogram = Listogram(bigrams)
+        for bigram in bigrams:
+            assert bigram in histogram
+            assert histogram.frequency(bigram) == 1
+        assert ('the', 'dog') not in histogram
+        assert histogram.index_of(['unhashable']) is None
+        histogram.add_count(('the', 'cat'), 2)
+        assert histogram.frequency(('the', 'cat')) == 3
+
+    def test_held_sampler_sample_many_after_rebuild(self):
+        histogram = Listogram(['a', 'x'] + ['b'] * 98)
+        sampler = histogram.sampler
+        histogram.add_count('c', 1000)
+        histogram.frequency('c')
+        assert set(sampler.randbins(2000)) <= {'a', 'x', 'b'}
+
     def test_frequency(self):
         histogram = Listogram(self.fish_words)
         # Verify frequency count of all words
@@ -67,6 +98,26 @@ class ListogramTest(unittest.TestCase):
         # Verify total count of all word tokens
         assert histogram.token_count == 8 + 14
 
+    def test_add_count_after_rebuild(self):
+        histogram = Listogram(self.fish_words)
+        histogram.add_count('fish', 2)
+        assert histogram.frequency('fish') == 6
+        # counts that were already merged shouldn't be added again
+        histogram.add_count('red')
+        assert histogram.frequency('fish') == 6
+        assert histogram.frequency('red') == 2
+
+    def test_add_counts(self):
+        histogram = Listogram(self.fish_words)
+        histogram.add_counts(['two', 'two', 'fish', 'food'])
+        histogram.add_counts(iter(['fish', 'food']))
+        assert histogram.frequency('one') == 1
+        assert histogram.frequency('two') == 3
+        assert histogram.frequency('fish') == 6
+        assert histogram.frequency('food') == 2
+        assert histogram.type_count == 6
+        assert histogram.token_count == 8 + 6
+
     def test_tokens(self):
         histogram = Listogram(self.fish_words)
         # Verify total count of all word tokens
@@ -11,9 +11,23 @@ class HashTableTest(unittest.TestCase):
 
     def test_init(self):
         ht = HashTable(4)
-        assert len(ht.buckets) == 4
+        assert len(ht._keys) == 4
         assert ht.length() == 0
 
+        # sizes are rounded up to the next power of two
+        ht = HashTable(5)
+        assert len(ht._keys) == 8
+
+    def test_resize(self):
+        ht = HashTable(4)
+        for i in range(4):
+            ht.set(i, i)
+        # the table grows before load goes over load_factor
+        assert len(ht._keys) == 8
+        assert ht.load <= ht.load_factor
+        for i in range(4):
+            assert ht.get(i) == i
+
     def test_keys(self):
         ht = HashTable()
         assert ht.keys() == []
@@ -139,6 +153,23 @@ class HashTableTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             ht.delete('A')  # Key does not exist
 
+    def test_collisions(self):
+        # small ints hash to themselves, so these all share a home slot
+        ht = HashTable(8)
+        colliding_keys = [8 * i for i in range(6)]
+        for key in colliding_keys:
+            ht.set(key, str(key))
+        for key in colliding_keys:
+            assert ht.get(key) == str(key)
+
+        # deleting from the middle of a probe sequence shouldn't hide the keys
+        # after it
+        ht.delete(16)
+        assert ht.contains(16) is False
+        for key in (0, 8, 24, 32, 40):
+            assert ht.get(key) == str(key)
+        assert ht.length() == 5
+
     def test_iterability(self):
         ht = HashTable()
 
@@ -76,6 +76,53 @@ class SampleTestSuite(unittest.TestCase):
         self.assertLess(freqdist.similarity(samples), 0.05)
 
 
+    def test_batch_generation(self):
+        N_SAMPLES = 10000
+        freqdist = FreqDist(dict(TD.COLOR_TUPLE_FREQS), sort_data=False)
+        sample = Sample(freqdist)
+
+        samples = sample.randbins(N_SAMPLES)
+        self.assertEqual(len(samples), N_SAMPLES)
+        self.assertEqual(sample.cumulative[-1], freqdist.token_count)
+
+        samples = FreqDist(Counter(samples))
+        self.assertLess(freqdist.similarity(samples), 0.05)
+
+    def test_sampling_method(self):
+        freqdist = FreqDist(TD.COLOR_TUPLE_FREQS, sort_data=False)
+        sample = Sample(freqdist)
+
+        # max weight is within MAX_ACCEPTANCE_RATIO of the mean, so the alias
+        # table isn't needed
+        self.assertTrue(sample.use_acceptance)
+        self.assertEqual(sample.w_max, 20)
+
+        skewed_freqdist = FreqDist((("apple", 1), ("banana", 1), ("kiwi", 98)))
+        skewed_sample = Sample(skewed_freqdist)
+        self.assertFalse(skewed_sample.use_acceptance)
+
+        sample_counts = Counter(skewed_sample.randbin() for _ in range(10000))
+        self.assertLess(skewed_freqdist.similarity(FreqDist(sample_counts)),
+                        0.05)
+
+
+    def test_zero_weight(self):
+        zero_freqdist = FreqDist((("apple", 0), ("banana", 0)))
+        sample = Sample(zero_freqdist)
+        self.assertFalse(sample.use_acceptance)
+        with self.assertRaises(ValueError):
+            sample.randbin()
+
+        with self.assertRaises(ValueError):
+            Sample(FreqDist(())).randbin()
+
+        with self.assertRaises(ValueError):
+            sample.randbins(10)
+
+        with self.assertRaises(ValueError):
+            Sample(FreqDist(())).randbins(10)
+
+
 class TestTestData(unittest.TestCase):
 
     def test_color_probs_sum_to_one(self):
@@ -149,6 +149,32 @@ class LogMethodCallsTestSuite(unittest.TestCase):
         c.cmethod()
         self.assertEqual(len(c._logs_), 0)
 
+    def test_metaclass_no_log(self):
+
+        class Base:
+            _NO_LOG = frozenset(("read",))
+
+        class C(Base, metaclass=LogMethodCalls):
+            _NO_LOG = frozenset(("peek",))
+
+            def read(self):
+                pass
+
+            def peek(self):
+                pass
+
+            def write(self):
+                pass
+
+        c = C()
+        c.write()
+        c.read()
+        c.peek()
+
+        # methods named in _NO_LOG, including a base's, aren't logged
+        self.assertEqual([log.name for log in c._logs_], ["write"])
+        self.assertEqual(C.__name__, "C")
+
     def test_times(self):
         pass
 